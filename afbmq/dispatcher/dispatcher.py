@@ -1,5 +1,8 @@
 import asyncio
+import collections
+import contextvars
 import functools
+import inspect
 import logging
 import typing
 
@@ -8,7 +11,7 @@ from afbmq.dispatcher.filters import StateFilter, Command, Text, Regexp, \
     ExceptionsFilter, IDFilter, IsReplyFilter
 from afbmq.types import Entry, MessageEvent
 from .filters import FiltersFactory
-from .handler import Handler
+from .handler import CancelHandler, Handler, SkipHandler
 from .middlewares import MiddlewareManager
 from .storage import DisabledStorage, FSMContext
 from ..fb import FB
@@ -17,8 +20,23 @@ from ..utils.mixins import ContextInstanceMixin, DataMixin
 MODE = 'MODE'
 EVENT_OBJECT = 'event_object'
 
+# Entries fed by webhook are processed in batches
+ENTRIES_BATCH_SIZE = 32
+ENTRIES_BATCH_TIMEOUT = 0.005
+
 logger = logging.getLogger(__name__)
 
+# Built-in filters and names of the handlers they are bound (or not bound) to
+DEFAULT_FILTERS_BINDINGS = (
+    (StateFilter, {'exclude_event_handlers': ('errors_handlers',)}),
+    (Command, {'event_handlers': ('message_handlers',)}),
+    (Text, {'event_handlers': ('message_handlers',)}),
+    (Regexp, {'event_handlers': ('message_handlers',)}),
+    (ExceptionsFilter, {'event_handlers': ('errors_handlers',)}),
+    (IDFilter, {'event_handlers': ('message_handlers',)}),
+    (IsReplyFilter, {'event_handlers': ('message_handlers',)}),
+)
+
 
 class Dispatcher(DataMixin, ContextInstanceMixin):
     def __init__(self, fb, storage=None, loop=None, filters_factory=None):
@@ -34,7 +52,7 @@ class Dispatcher(DataMixin, ContextInstanceMixin):
         self.storage = storage or DisabledStorage()
         self.fb: FB = fb
         self.loop = loop
-        self.run_tasks_by_default = True
+        self.run_tasks_by_default = False
 
         self.filters_factory: FiltersFactory = filters_factory
         self.events_handler = Handler(self, middleware_key='event')
@@ -44,9 +62,21 @@ class Dispatcher(DataMixin, ContextInstanceMixin):
         self.middleware = MiddlewareManager(self)
         self.events_handler.register(self.process_event)
 
+        # Supported event types
+        self._event_dispatch = {
+            MessageEvent: self.events_handler.notify,
+        }
+
         self._closed = True
         self._close_waiter = loop.create_future()
 
+        # Strong references to tasks started by dispatcher
+        self._running_tasks = set()
+
+        self._pending_entries = collections.deque()
+        self._pending_entries_event = None
+        self._drain_task = None
+
         self._key = None
         self._server = None
         self._ts = None
@@ -56,27 +86,9 @@ class Dispatcher(DataMixin, ContextInstanceMixin):
     def _setup_filters(self):
         filters_factory = self.filters_factory
 
-        filters_factory.bind(StateFilter, exclude_event_handlers=[
-            self.errors_handlers,
-        ])
-        filters_factory.bind(Command, event_handlers=[
-            self.message_handlers,
-        ])
-        filters_factory.bind(Text, event_handlers=[
-            self.message_handlers,
-        ])
-        filters_factory.bind(Regexp, event_handlers=[
-            self.message_handlers,
-        ])
-        filters_factory.bind(ExceptionsFilter, event_handlers=[
-            self.errors_handlers,
-        ])
-        filters_factory.bind(IDFilter, event_handlers=[
-            self.message_handlers,
-        ])
-        filters_factory.bind(IsReplyFilter, event_handlers=[
-            self.message_handlers,
-        ])
+        for filter_, config in DEFAULT_FILTERS_BINDINGS:
+            filters_factory.bind(filter_, **{key: [getattr(self, name) for name in handlers]
+                                             for key, handlers in config.items()})
 
     async def process_entries(self, entries: typing.List[Entry]):
         """
@@ -85,12 +97,95 @@ class Dispatcher(DataMixin, ContextInstanceMixin):
         :param entries:
         :return:
         """
-        tasks = []
-        for entry in entries:
-            event = entry.messaging[0]
-            if isinstance(event, MessageEvent):
-                tasks.append(self.events_handler.notify(event))
-        return await asyncio.gather(*tasks)
+        dispatch = self._event_dispatch
+        events = [event for entry in entries for event in entry.messaging if type(event) in dispatch]
+
+        if not events:
+            return []
+
+        if len(events) == 1:
+            event = events[0]
+            return [await dispatch[type(event)](event)]
+
+        return await asyncio.gather(*(dispatch[type(event)](event) for event in events))
+
+    def feed_entries(self, entries: typing.List[Entry]):
+        """
+        Put entries to the queue. Queued entries are processed in batches
+        when the batch is full or after short timeout.
+
+        :param entries:
+        """
+        self._pending_entries.extend(entries)
+
+        if self._pending_entries_event is None:
+            self._pending_entries_event = asyncio.Event()
+        self._pending_entries_event.set()
+
+        if self._drain_task is None or self._drain_task.done():
+            # Drain task and batches started by it must not inherit context of the current request
+            self._drain_task = contextvars.Context().run(asyncio.ensure_future, self._drain_entries())
+
+    async def _drain_entries(self):
+        pending = self._pending_entries
+        event = self._pending_entries_event
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await event.wait()
+
+            deadline = loop.time() + ENTRIES_BATCH_TIMEOUT
+            while len(pending) < ENTRIES_BATCH_SIZE:
+                event.clear()
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            event.clear()
+
+            entries = list(pending)
+            pending.clear()
+            if entries:
+                task = asyncio.ensure_future(self._process_entries_batch(entries))
+                self._running_tasks.add(task)
+                task.add_done_callback(self._entries_batch_done)
+
+    async def _process_entries_batch(self, entries: typing.List[Entry]):
+        Dispatcher.set_current(self)
+        FB.set_current(self.fb)
+        return await self.process_entries(entries)
+
+    def _entries_batch_done(self, task: asyncio.Future):
+        self._running_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error('Failed to process entries', exc_info=task.exception())
+
+    async def flush_entries(self):
+        """
+        Stop batching entries fed by webhook, process the queued ones
+        and wait for all running tasks (should be called on shutdown)
+        """
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+
+        entries = list(self._pending_entries)
+        self._pending_entries.clear()
+        if entries:
+            try:
+                await contextvars.Context().run(asyncio.ensure_future, self._process_entries_batch(entries))
+            except Exception:
+                logger.exception('Failed to process entries')
+
+        while self._running_tasks:
+            await asyncio.gather(*self._running_tasks, return_exceptions=True)
 
     async def process_event(self, event):
         """
@@ -99,7 +194,7 @@ class Dispatcher(DataMixin, ContextInstanceMixin):
         :param event:
         :return:
         """
-        if isinstance(event, MessageEvent):
+        if type(event) is MessageEvent:
             types.Recipient.set_current(event.recipient)
             types.Sender.set_current(event.sender)
             return await self.message_handlers.notify(event, event.message)
@@ -139,23 +234,32 @@ class Dispatcher(DataMixin, ContextInstanceMixin):
         """
         Execute handler as task and return None.
 
+        Handler result is not returned to the caller, SkipHandler/CancelHandler raised
+        by such handler can't affect other handlers and post-process middlewares
+        don't wait for it.
 
         :param func:
         :return:
         """
 
-        def process_response(task):
-            try:
-                task.result()
+        notify_error = self.errors_handlers.notify
+        running_tasks = self._running_tasks
 
-            except Exception as e:
-                self.loop.create_task(
-                    self.errors_handlers.notify(self, task.context.get(EVENT_OBJECT, None), e))
+        def process_response(event, task):
+            running_tasks.discard(task)
+            if task.cancelled():
+                return
+            exception = task.exception()
+            if isinstance(exception, Exception) and not isinstance(exception, (SkipHandler, CancelHandler)):
+                error_task = asyncio.ensure_future(notify_error(event, exception))
+                running_tasks.add(error_task)
+                error_task.add_done_callback(running_tasks.discard)
 
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            task = self.loop.create_task(func(*args, **kwargs))
-            task.add_done_callback(process_response)
+            task = asyncio.create_task(func(*args, **kwargs))
+            running_tasks.add(task)
+            task.add_done_callback(functools.partial(process_response, args[0] if args else None))
 
         return wrapper
 
@@ -163,7 +267,8 @@ class Dispatcher(DataMixin, ContextInstanceMixin):
         if run_task is None:
             run_task = self.run_tasks_by_default
 
-        if run_task:
+        # Only coroutine functions can be scheduled as tasks
+        if run_task and inspect.iscoroutinefunction(callback):
             return self.async_task(callback)
         return callback
 
@@ -1,5 +1,6 @@
 import inspect
 import re
+import sys
 import typing
 from contextvars import ContextVar
 from dataclasses import dataclass, field
@@ -11,6 +12,48 @@ from afbmq import types
 from afbmq.dispatcher.filters.filters import BoundFilter, Filter
 from afbmq.types import MessageEvent, Event
 
+# dataclass(slots=True) is available since Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _parse_command(message: types.Message) -> Optional[typing.Tuple[str, str, str]]:
+    """
+    Split the first word of the message text to prefix, command and mention.
+
+    Result is stored in the message, so all command filters checking the same message parse it only once.
+
+    :param message:
+    :return: tuple of prefix, command and mention or None for empty text
+    """
+    text = message.text
+    cached = message._parsed_command
+    if cached is not None and cached[0] is text:
+        return cached[1]
+
+    parts = text.split(None, 1)
+    if parts:
+        full_command = parts[0]
+        prefix, (command, _, mention) = full_command[0], full_command[1:].partition('@')
+        parsed = prefix, command, mention
+    else:
+        parsed = None
+    message._parsed_command = text, parsed
+    return parsed
+
+
+async def _get_me_username_lower(fb) -> str:
+    """
+    Get lowercased username of the current bot. Result is memoized on the FB instance.
+
+    :param fb: FB instance
+    :return: lowercased username
+    """
+    username = getattr(fb, '_me_username_lower', None)
+    if username is None:
+        username = (await fb.me).username.lower()
+        fb._me_username_lower = username
+    return username
+
 
 class Command(Filter):
     """
@@ -46,8 +89,8 @@ class Command(Filter):
         if isinstance(commands, str):
             commands = (commands,)
 
-        self.commands = list(map(str.lower, commands)) if ignore_case else commands
-        self.prefixes = prefixes
+        self.commands = frozenset(command.lower() for command in commands) if ignore_case else frozenset(commands)
+        self.prefixes = frozenset(prefixes)
         self.ignore_case = ignore_case
         self.ignore_mention = ignore_mention
 
@@ -82,19 +125,21 @@ class Command(Filter):
         if not message.text:  # Prevent to use with non-text content types
             return False
 
-        full_command = message.text.split()[0]
-        prefix, (command, _, mention) = full_command[0], full_command[1:].partition('@')
-
-        if not ignore_mention and mention and (await message.fb.me).username.lower() != mention.lower():
+        parsed = _parse_command(message)
+        if parsed is None:
             return False
+        prefix, command, mention = parsed
+
         if prefix not in prefixes:
             return False
         if (command.lower() if ignore_case else command) not in commands:
             return False
+        if not ignore_mention and mention and await _get_me_username_lower(message.fb) != mention.lower():
+            return False
 
         return {'command': Command.CommandObj(command=command, prefix=prefix, mention=mention)}
 
-    @dataclass
+    @dataclass(**_DATACLASS_SLOTS)
     class CommandObj:
         """
         Instance of this object is always has command and it prefix.
@@ -204,6 +249,19 @@ class CommandPrivacy(Command):
         super().__init__(['privacy'])
 
 
+def _drop_redundant_substrings(patterns: typing.Tuple[str, ...]) -> typing.Tuple[str, ...]:
+    """
+    Remove duplicates and patterns which are substrings of other patterns.
+    Text which contains all of the remaining patterns contains the removed ones too.
+
+    :param patterns:
+    :return: reduced patterns
+    """
+    patterns = tuple(dict.fromkeys(patterns))
+    return tuple(pattern for index, pattern in enumerate(patterns)
+                 if not any(pattern in other for other_index, other in enumerate(patterns) if other_index != index))
+
+
 class Text(Filter):
     """
     Simple text filter
@@ -247,11 +305,44 @@ class Text(Filter):
         equals, contains, endswith, startswith = map(lambda e: [e] if isinstance(e, str) or isinstance(e, LazyProxy)
         else e,
                                                      (equals, contains, endswith, startswith))
-        self.equals = equals
-        self.contains = contains
-        self.endswith = endswith
-        self.startswith = startswith
+        # Lists with LazyProxy items can be resolved to different strings (e.g. for different locales),
+        # so they are normalized on every check. Other patterns are normalized only once.
+        self._lazy = any(isinstance(item, LazyProxy)
+                         for patterns in (equals, contains, endswith, startswith) if patterns is not None
+                         for item in patterns)
         self.ignore_case = ignore_case
+        self.equals = self._prepare_patterns(equals)
+        self.contains = self._prepare_patterns(contains)
+        self.endswith = self._prepare_patterns(endswith)
+        self.startswith = self._prepare_patterns(startswith)
+
+        if self.contains is not None and not self._lazy:
+            self.contains = _drop_redundant_substrings(self.contains)
+
+        if self.equals is not None:
+            self._check_fn = self._check_equals
+        elif self.contains is not None:
+            self._check_fn = self._check_contains
+        elif self.startswith is not None:
+            self._check_fn = self._check_startswith
+        else:
+            self._check_fn = self._check_endswith
+
+    def _pre_process(self, value) -> str:
+        value = str(value)
+        return value.lower() if self.ignore_case else value
+
+    def _prepare_patterns(self, patterns):
+        if patterns is None:
+            return None
+        if self._lazy:
+            return tuple(patterns)
+        return tuple(map(self._pre_process, patterns))
+
+    def _resolve_patterns(self, patterns) -> typing.Tuple[str, ...]:
+        if self._lazy:
+            return tuple(map(self._pre_process, patterns))
+        return patterns
 
     @classmethod
     def validate(cls, full_config: Dict[str, Any]):
@@ -259,35 +350,24 @@ class Text(Filter):
             if param in full_config:
                 return {key: full_config.pop(param)}
 
-    async def check(self, event: Union[types.MessageEvent], obj: Union[types.Message]):
-        if isinstance(event, MessageEvent):
-            text = obj.text
-        else:
-            return False
-        if self.ignore_case:
-            text = text.lower()
-            _pre_process_func = lambda s: str(s).lower()
-        else:
-            _pre_process_func = str
+    def _check_equals(self, text: str) -> bool:
+        return text in self._resolve_patterns(self.equals)
 
-        # now check
-        if self.equals is not None:
-            equals = list(map(_pre_process_func, self.equals))
-            return text in equals
+    def _check_contains(self, text: str) -> bool:
+        return all(map(text.__contains__, self._resolve_patterns(self.contains)))
 
-        if self.contains is not None:
-            contains = list(map(_pre_process_func, self.contains))
-            return all(map(text.__contains__, contains))
+    def _check_startswith(self, text: str) -> bool:
+        return text.startswith(self._resolve_patterns(self.startswith))
 
-        if self.startswith is not None:
-            startswith = list(map(_pre_process_func, self.startswith))
-            return any(map(text.startswith, startswith))
+    def _check_endswith(self, text: str) -> bool:
+        return text.endswith(self._resolve_patterns(self.endswith))
 
-        if self.endswith is not None:
-            endswith = list(map(_pre_process_func, self.endswith))
-            return any(map(text.endswith, endswith))
+    async def check(self, event: Union[types.MessageEvent], obj: Union[types.Message]):
+        if not isinstance(event, MessageEvent):
+            return False
 
-        return False
+        text = obj.text.lower() if self.ignore_case else obj.text
+        return self._check_fn(text)
 
 
 class Regexp(Filter):
@@ -341,13 +421,22 @@ class StateFilter(BoundFilter):
                 states.extend(item.all_states_names)
             else:
                 states.append(item)
-        self.states = states
+        self._wildcard = '*' in states
+        self.states = frozenset(states)
 
     def get_target(self, obj):
-        return getattr(getattr(obj, 'recipient', None), 'id', None), getattr(getattr(obj, 'sender', None), 'id', None)
+        try:
+            chat = obj.recipient.id
+        except AttributeError:
+            chat = None
+        try:
+            user = obj.sender.id
+        except AttributeError:
+            user = None
+        return chat, user
 
     async def check(self, event: Event, obj):
-        if '*' in self.states:
+        if self._wildcard:
             return {'state': self.dispatcher.current_state()}
 
         try:
@@ -378,12 +467,7 @@ class ExceptionsFilter(BoundFilter):
         self.exception = exception
 
     async def check(self, update, exception):
-        try:
-            raise exception
-        except self.exception:
-            return True
-        except:
-            return False
+        return isinstance(exception, self.exception)
 
 
 class IDFilter(Filter):
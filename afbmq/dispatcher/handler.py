@@ -56,7 +56,7 @@ class Handler:
         :param filters: list of filters
         :param index: you can reorder handlers
         """
-        spec, handler = _get_spec(handler)
+        spec, _ = _get_spec(handler)
 
         if filters and not isinstance(filters, (list, tuple, set)):
             filters = [filters]
@@ -77,7 +77,7 @@ class Handler:
         """
         for handler_obj in self.handlers:
             registered = handler_obj.handler
-            if handler is registered:
+            if handler is registered or handler is _get_spec(registered)[1]:
                 self.handlers.remove(handler_obj)
                 return True
         raise ValueError('This handler is not registered!')
@@ -1,6 +1,6 @@
-import asyncio
-import ipaddress
 import logging
+import socket
+import struct
 
 from aiohttp import web
 from aiohttp.web_exceptions import HTTPGone
@@ -8,13 +8,14 @@ from aiohttp.web_exceptions import HTTPGone
 from afbmq import FB
 from afbmq.dispatcher import Dispatcher
 from afbmq.types import WebhookEvent
-from afbmq.utils import context
+from afbmq.utils import context, json
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_WEB_PATH = '/webhook'
 DEFAULT_ROUTE_NAME = 'webhook_handler'
 FB_DISPATCHER_KEY = 'FB_DISPATCHER'
+CHECK_IP_KEY = '_check_ip'
 
 RESPONSE_TIMEOUT = 55
 
@@ -22,21 +23,28 @@ WEBHOOK = 'webhook'
 WEBHOOK_CONNECTION = 'WEBHOOK_CONNECTION'
 WEBHOOK_REQUEST = 'WEBHOOK_REQUEST'
 
-# IP filter
+# IP filter (addresses are stored as 32-bit integers)
 allowed_ips = set()
 
 
+def _ip_to_int(ip: str) -> int:
+    return struct.unpack('!I', socket.inet_aton(ip))[0]
+
+
 def _check_ip(ip: str) -> bool:
     """ Check IP in range. """
-    # address = ipaddress.IPv4Address(ip)
-    # return address in allowed_ips
     # todo add fb ip
-    return True
+    if not allowed_ips:
+        return True
+    try:
+        return _ip_to_int(ip) in allowed_ips
+    except OSError:
+        return False
 
 
 def allow_ip(*ips: str):
     """ Allow ip address. """
-    allowed_ips.update(ipaddress.IPv4Address(ip) for ip in ips)
+    allowed_ips.update(_ip_to_int(ip) for ip in ips)
 
 
 class WebhookRequestHandler(web.View):
@@ -83,11 +91,11 @@ class WebhookRequestHandler(web.View):
         :param fb: FB instance. You an get it from Dispatcher
         :return: :class:`afbmq.types.Update`
         """
-        data = await self.request.json()
-        logger.debug(f'Received request: {self.request} {data}')
+        data = json.loads(await self.request.read())
+        logger.debug('Received request: %s %s', self.request, data)
 
-        event = WebhookEvent(**data)
-        logger.debug(f'New event: {event}')
+        event = WebhookEvent.parse_obj(data)
+        logger.debug('New event: %s', event)
         return event.entry
 
     async def post(self):
@@ -101,7 +109,7 @@ class WebhookRequestHandler(web.View):
         dispatcher = self.get_dispatcher()
         entries = await self.parse_event(dispatcher.fb)
 
-        asyncio.ensure_future(dispatcher.process_entries(entries))
+        dispatcher.feed_entries(entries)
         return web.Response(text='ok')
 
     async def get(self):
@@ -145,7 +153,7 @@ class WebhookRequestHandler(web.View):
         """
         Check ip if that is needed. Raise web.HTTPUnauthorized for not allowed hosts.
         """
-        if self.request.app.get('_check_ip', False):
+        if self.request.app.get(CHECK_IP_KEY, False):
             ip_address, accept = self.check_ip()
             if not accept:
                 raise web.HTTPUnauthorized()
@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import logging
 import ssl
+import sys
 import typing
+import weakref
 from contextvars import ContextVar
 
 import aiohttp
 import certifi
+import yarl
 from aiohttp import ClientSession
 from aiohttp.helpers import sentinel
 
@@ -18,6 +22,101 @@ from .utils.mixins import DataMixin, ContextInstanceMixin
 logger = logging.getLogger(__name__)
 
 API_URL = 'https://graph.facebook.com'
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Aborted SSL transports are leaked (and must be closed by the connector) before Python 3.12.8 / 3.13.1
+_CLEANUP_CLOSED = sys.version_info < (3, 12, 8) or (3, 13) <= sys.version_info < (3, 13, 1)
+
+
+@functools.lru_cache(maxsize=16)
+def _total_timeout(value: typing.Union[int, float]) -> aiohttp.ClientTimeout:
+    """
+    ClientTimeout is immutable, so one instance is shared for each commonly used value.
+    """
+    return aiohttp.ClientTimeout(total=value)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_ssl_context() -> ssl.SSLContext:
+    """
+    SSL context with certifi CA bundle. The bundle is loaded only once.
+    """
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+# Sessions are shared by all FB instances with the same loop and SSL context,
+# so consecutive requests to Graph API reuse kept-alive connections from one pool.
+_sessions: typing.Dict[tuple, ClientSession] = {}
+_sessions_users: typing.Dict[tuple, weakref.WeakSet] = {}
+
+
+def _get_resolver(loop: asyncio.AbstractEventLoop) -> typing.Optional[aiohttp.abc.AbstractResolver]:
+    """
+    Use aiodns based resolver if aiodns is installed
+    (aiohttp 3.10+ needs DNSResolver.getaddrinfo which is missing in aiodns<3.2)
+    """
+    try:
+        import aiodns
+    except ImportError:
+        return None
+    if not hasattr(aiodns.DNSResolver, 'getaddrinfo'):
+        return None
+    return aiohttp.AsyncResolver(loop=loop)
+
+
+def _get_loop(fb: FB) -> asyncio.AbstractEventLoop:
+    """
+    Session is bound to the running loop (it can differ from fb.loop, e.g. in aiohttp.web.run_app)
+    """
+    loop = asyncio._get_running_loop()
+    if loop is None:
+        loop = fb.loop
+    return loop
+
+
+def _drop_closed_loops_sessions():
+    for key in [key for key in _sessions if key[0].is_closed()]:
+        del _sessions[key]
+        _sessions_users.pop(key, None)
+
+
+def _acquire_session(fb: FB, loop: asyncio.AbstractEventLoop) -> ClientSession:
+    _drop_closed_loops_sessions()
+
+    if fb._session_key is not None and fb._session_key in _sessions_users:
+        # FB instance is used from another loop now
+        _sessions_users[fb._session_key].discard(fb)
+
+    key = (loop, fb.ssl_context)
+    session = _sessions.get(key)
+    if session is None or session.closed:
+        # Graph API is a single host serving many small requests: keep a large pool of
+        # long-living connections to it, so sends reuse already established TLS connections
+        connector = aiohttp.TCPConnector(ssl=fb.ssl_context, limit=200, limit_per_host=64,
+                                         keepalive_timeout=120, enable_cleanup_closed=_CLEANUP_CLOSED,
+                                         use_dns_cache=True, ttl_dns_cache=600, resolver=_get_resolver(loop),
+                                         loop=loop)
+        session = ClientSession(json_serialize=json.dumps, connector=connector, loop=loop)
+        _sessions[key] = session
+    _sessions_users.setdefault(key, weakref.WeakSet()).add(fb)
+    fb._session_key = key
+    return session
+
+
+async def _release_session(fb: FB):
+    key = fb._session_key
+    fb._session_key = None
+    users = _sessions_users.get(key)
+    if users is None:
+        return
+    users.discard(fb)
+    if users:
+        return
+
+    del _sessions_users[key]
+    session = _sessions.pop(key, None)
+    if session is not None and not session.closed:
+        await session.close()
 
 
 class FB(DataMixin, ContextInstanceMixin):
@@ -30,41 +129,67 @@ class FB(DataMixin, ContextInstanceMixin):
         self.confirmation_code = confirmation_code
         self.access_token = access_token
         self.api_version = '5.0'
+        self._timeout = None
 
         # asyncio loop instance
         if loop is None:
             loop = asyncio.get_event_loop()
         self.loop = loop
 
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        self.connector = aiohttp.TCPConnector(ssl_context=ssl_context, loop=self.loop)
-        self._session = ClientSession(loop=self.loop, json_serialize=json.dumps, connector=self.connector)
+        self.ssl_context = _default_ssl_context()
+        # Shared session is acquired on first request
+        self._session: typing.Optional[ClientSession] = None
+        self._session_key = None
+        # Method URLs with access token, built for current api_version and access_token
+        self._urls: typing.Dict[str, yarl.URL] = {}
+        self._urls_key = None
 
-        # methods
-        _data = {'access_token': access_token, 'session': self._session, 'api_version': self.api_version}
+    def _method_url(self, method_name: str) -> yarl.URL:
+        """
+        Build (and cache) API method URL, so it is not parsed and encoded again on every request.
+        """
+        key = self.api_version, self.access_token
+        if self._urls_key != key:
+            self._urls = {}
+            self._urls_key = key
+        url = self._urls.get(method_name)
+        if url is None:
+            url = yarl.URL(f'{API_URL}/v{self.api_version}/') / method_name.lstrip('/')
+            url = self._urls[method_name] = url.with_query(access_token=self.access_token)
+        return url
 
     @property
-    def session(self):
-        if not self._session:
-            self._session = ClientSession(loop=self.loop, json_serialize=json.dumps, connector=self.connector)
+    def session(self) -> ClientSession:
+        loop = _get_loop(self)
+        if self._session is None or self._session.closed or self._session_key[0] is not loop:
+            self._session = _acquire_session(self, loop)
         return self._session
 
     async def api_request(self, method_name, parameters):
 
-        link = f'{API_URL}/v{self.api_version}/{method_name}?access_token={self.access_token}'
-        async with self.session.post(link, json=parameters) as resp:
+        link = self._method_url(method_name)
+        timeout = self.timeout
+        async with self.session.post(link, data=json.dumps_bytes(parameters), headers=JSON_HEADERS,
+                                     timeout=timeout) as resp:
             status = resp.status
-            text = await resp.text()
-            logger.info(f'Response: {status}, {text}')
+            raw = await resp.read()
+            logger.info('Response: %s, %d bytes', status, len(raw),
+                        extra={'method': method_name, 'status': status, 'body_len': len(raw)})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Response body: %s', raw.decode('utf-8', 'replace'))
         try:
-            result_json = json.loads(text)
+            result_json = json.loads(raw)
         except ValueError:
             result_json = {}
         return result_json
 
     async def close(self):
-        if isinstance(self._session, ClientSession) and not self._session.closed:
-            await self._session.close()
+        """
+        Release shared session. It is closed when no other FB instance uses it.
+        """
+        if self._session is not None:
+            self._session = None
+            await _release_session(self)
 
     @staticmethod
     def _prepare_timeout(
@@ -72,7 +197,7 @@ class FB(DataMixin, ContextInstanceMixin):
     ) -> typing.Optional[aiohttp.ClientTimeout]:
         if value is None or isinstance(value, aiohttp.ClientTimeout):
             return value
-        return aiohttp.ClientTimeout(total=value)
+        return _total_timeout(value)
 
     @property
     def timeout(self):
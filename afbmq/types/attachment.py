@@ -1,6 +1,6 @@
 import typing
 
-from pydantic import AnyUrl
+from pydantic import AnyUrl, validator
 
 from .base import FBObject
 
@@ -25,6 +25,24 @@ class AttachmentFallback(FBObject):
     type: str = 'fallback'
 
 
+# Payload model by attachment type
+PAYLOAD_TYPES = {
+    'audio': MediaPayload,
+    'file': MediaPayload,
+    'image': MediaPayload,
+    'video': MediaPayload,
+    'location': LocationPayload,
+}
+
+
 class Attachment(FBObject):
     type: str  # template, audio, fallback, file, image, location or video
-    payload: typing.Union[MediaPayload, Coors, None]
+    # MediaPayload or LocationPayload (selected by type), raw value for other types
+    payload: typing.Any = None
+
+    @validator('payload', pre=True)
+    def _parse_payload(cls, value, values):
+        model = PAYLOAD_TYPES.get(values.get('type'))
+        if model is None or value is None or isinstance(value, model):
+            return value
+        return model.parse_obj(value)
@@ -8,8 +8,6 @@ from afbmq.utils.mixins import ContextInstanceMixin
 class FBObject(BaseModel, ContextInstanceMixin):
     @property
     def fb(self) -> FB:
-        from ..fb import FB
-
         fb = FB.get_current()
         if fb is None:
             raise RuntimeError("Can't get fb instance from context. "
@@ -20,3 +18,5 @@ class FBObject(BaseModel, ContextInstanceMixin):
     class Config:
         json_loads = json.loads
         json_dumps = json.dumps
+        # Don't copy model instances passed as fields of other models
+        copy_on_model_validation = 'none'
@@ -1,23 +1,62 @@
 import typing
+import weakref
 from datetime import datetime
 
+from pydantic import root_validator
+
 from afbmq.types import Message
 from .base import FBObject
 
 
-class Sender(FBObject):
-    id: str
+# Alive Sender and Recipient objects by (class, id)
+_participants = weakref.WeakValueDictionary()
 
 
-class Recipient(FBObject):
+class _Participant(FBObject):
     id: str
 
+    @classmethod
+    def get_or_create(cls, id: str):
+        """
+        Get alive instance with this id or create new one
+
+        :param id:
+        :return:
+        """
+        key = cls, str(id)
+        instance = _participants.get(key)
+        if instance is None:
+            instance = _participants[key] = cls(id=id)
+        return instance
+
+    class Config:
+        # Instances are shared between events (see get_or_create)
+        allow_mutation = False
+
+
+class Sender(_Participant):
+    pass
+
+
+class Recipient(_Participant):
+    pass
+
 
 class Event(FBObject):
     sender: Sender
     recipient: Recipient
     timestamp: datetime
 
+    @root_validator(pre=True)
+    def _reuse_participants(cls, values):
+        values = dict(values)
+        for key, model in (('sender', Sender), ('recipient', Recipient)):
+            value = values.get(key)
+            # Other ids are left for field validation, so errors point to the field
+            if isinstance(value, dict) and isinstance(value.get('id'), str):
+                values[key] = model.get_or_create(value['id'])
+        return values
+
 
 class MessageEvent(Event):
     message: Message
@@ -1,7 +1,8 @@
 import typing
 
+from pydantic import PrivateAttr
+
 from afbmq import types
-from afbmq.utils.payload import generate_payload
 from .attachment import Attachment, AttachmentFallback
 from .base import FBObject
 from .exceptions import FBException
@@ -27,6 +28,9 @@ class Message(FBObject):
     quick_reply: typing.Optional[QuickReply]
     reply_to: typing.Optional[ReplyTo]
 
+    # (text, (prefix, command, mention)) cached by command filters
+    _parsed_command = PrivateAttr(default=None)
+
     async def send_message(self, recipient: RecipientRequest, message: MessageRequest = None,
                            sender_action: str = None,
                            notification_type: str = None,
@@ -36,12 +40,22 @@ class Message(FBObject):
         if message is not None and sender_action is not None:
             raise FBException('sender_action cannot be sent with message. Must be sent as a separate request.')
 
-        if sender_action is not None and [key for key in locals().keys() if key is not None] != ['sender_action',
-                                                                                                 'recipient']:
-            raise FBException(
-                'When using sender_action, recipient should be the only other property set in the request.')
-
-        payload = generate_payload(**locals())
+        if sender_action is not None:
+            if notification_type is not None or tag is not None:
+                raise FBException(
+                    'When using sender_action, recipient should be the only other property set in the request.')
+            payload = {'recipient': recipient.dict(exclude_unset=True, exclude_none=True),
+                       'sender_action': sender_action}
+        else:
+            payload = {'recipient': recipient.dict(exclude_unset=True, exclude_none=True)}
+            if message is not None:
+                payload['message'] = message.dict(exclude_unset=True, exclude_none=True)
+            if notification_type is not None:
+                payload['notification_type'] = notification_type
+            if tag is not None:
+                payload['tag'] = tag
+            if messaging_type is not None:
+                payload['messaging_type'] = messaging_type
 
         result = await self.fb.api_request('/me/messages', payload)
         return types.MessageResponse(**result)
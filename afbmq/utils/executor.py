@@ -2,6 +2,7 @@ import asyncio
 import datetime
 import functools
 import logging
+import os
 import secrets
 from typing import Callable, Union, Optional, Any
 from warnings import warn
@@ -10,13 +11,44 @@ from aiohttp import web
 from aiohttp.web_app import Application
 
 from ..dispatcher.dispatcher import Dispatcher
-from ..dispatcher.webhook import FB_DISPATCHER_KEY, DEFAULT_ROUTE_NAME, WebhookRequestHandler
+from ..dispatcher.webhook import FB_DISPATCHER_KEY, CHECK_IP_KEY, DEFAULT_ROUTE_NAME, WebhookRequestHandler
 
 APP_EXECUTOR_KEY = 'APP_EXECUTOR'
 
 log = logging.getLogger(__name__)
 
 
+def setup_uvloop():
+    """
+    Use uvloop event loop policy if it is installed (can be disabled by DISABLE_UVLOOP environment variable).
+
+    Must be called before any event loop is created (so before creating FB and Dispatcher instances),
+    otherwise the loop which is already created would not be used by the new policy.
+    """
+    if 'DISABLE_UVLOOP' in os.environ or asyncio._get_running_loop() is not None:
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def setup_eager_tasks(loop: Optional[asyncio.AbstractEventLoop] = None):
+    """
+    Use eager task factory (Python 3.12+), so handlers which do not yield are finished right in create_task.
+
+    Installed only on the given (or current) loop and only if it has no task factory yet.
+    """
+    if not hasattr(asyncio, 'eager_task_factory'):
+        return
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    if loop.get_task_factory() is None:
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+
 def _setup_callbacks(executor: 'Executor', on_startup=None, on_shutdown=None):
     if on_startup is not None:
         executor.on_startup(on_startup)
@@ -237,7 +269,7 @@ class Executor:
         app[APP_EXECUTOR_KEY] = self
         app[FB_DISPATCHER_KEY] = self.dispatcher
         app[self._identity] = datetime.datetime.now()
-        app['_check_ip'] = self.check_ip
+        app[CHECK_IP_KEY] = self.check_ip
 
     def set_webhook(self, webhook_path: Optional[str] = None, request_handler: Any = WebhookRequestHandler,
                     route_name: str = DEFAULT_ROUTE_NAME, web_app: Optional[Application] = None):
@@ -301,6 +333,7 @@ class Executor:
         log.info(f"Bot: started")
 
     async def _shutdown(self):
+        await self.dispatcher.flush_entries()
         await self.dispatcher.storage.close()
         await self.dispatcher.storage.wait_closed()
         await self.dispatcher.fb.close()
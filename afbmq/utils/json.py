@@ -1,4 +1,5 @@
 import importlib
+import logging
 import os
 
 JSON = 'json'
@@ -8,7 +9,7 @@ ORJSON = 'orjson'
 
 # Detect mode
 mode = JSON
-for json_lib in (RAPIDJSON, ORJSON, UJSON):
+for json_lib in (ORJSON, RAPIDJSON, UJSON):
     if 'DISABLE_' + json_lib.upper() in os.environ:
         continue
 
@@ -30,6 +31,10 @@ if mode == RAPIDJSON:
         return json.loads(data, number_mode=json.NM_NATIVE,
                           datetime_mode=json.DM_ISO8601 | json.DM_NAIVE_IS_UTC)
 
+
+    def dumps_bytes(data):
+        return dumps(data).encode('utf-8')
+
 elif mode == ORJSON:
     def dumps(data):
         return json.dumps(data).decode('utf-8')
@@ -38,6 +43,10 @@ elif mode == ORJSON:
     def loads(data):
         return json.loads(data)
 
+
+    def dumps_bytes(data):
+        return json.dumps(data)
+
 elif mode == UJSON:
     def loads(data):
         return json.loads(data)
@@ -46,9 +55,17 @@ elif mode == UJSON:
     def dumps(data):
         return json.dumps(data, ensure_ascii=False)
 
+
+    def dumps_bytes(data):
+        return dumps(data).encode('utf-8')
+
 else:
     import json
 
+    if 'DISABLE_' + ORJSON.upper() not in os.environ:
+        logging.getLogger(__name__).warning("Fast JSON library is not found, standard 'json' is used. "
+                                            "Install 'orjson' (or 'afbmq[fast]') for faster JSON.")
+
 
     def dumps(data):
         return json.dumps(data, ensure_ascii=False)
@@ -56,3 +73,7 @@ else:
 
     def loads(data):
         return json.loads(data)
+
+
+    def dumps_bytes(data):
+        return dumps(data).encode('utf-8')
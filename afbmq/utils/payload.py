@@ -1,11 +1,12 @@
 import datetime
+import sys
 
-from babel.support import LazyProxy
 from pydantic import BaseModel
 
 from . import json
 
 DEFAULT_FILTER = ['self', 'cls']
+_DEFAULT_FILTER = frozenset(DEFAULT_FILTER)
 
 
 def generate_payload(exclude=None, **kwargs):
@@ -18,20 +19,10 @@ def generate_payload(exclude=None, **kwargs):
     :param kwargs:
     :return: dict
     """
-    _d = {}
-    if exclude is None:
-        exclude = set(DEFAULT_FILTER)
-    elif isinstance(exclude, list):
-        exclude = set(exclude + DEFAULT_FILTER)
-    for key, value in kwargs.items():
-        if value is None or key in exclude or key.startswith('_'):
-            continue
-        if isinstance(value, BaseModel):
-            _d[key] = generate_payload(exclude=exclude, **value.dict())
-        else:
-            _d[key] = value
-
-    return _d
+    exclude = _DEFAULT_FILTER if exclude is None else _DEFAULT_FILTER.union(exclude)
+    return {key: value.dict(exclude_none=True) if isinstance(value, BaseModel) else value
+            for key, value in kwargs.items()
+            if value is not None and key not in exclude and key[:1] != '_'}
 
 
 def _normalize(obj):
@@ -66,6 +57,8 @@ def prepare_arg(value):
         return int((now + value).timestamp())
     if isinstance(value, datetime.datetime):
         return round(value.timestamp())
-    if isinstance(value, LazyProxy):
+    # LazyProxy can't be created before babel is imported, so babel itself is not imported here
+    babel_support = sys.modules.get('babel.support')
+    if babel_support is not None and isinstance(value, babel_support.LazyProxy):
         return str(value)
     return value
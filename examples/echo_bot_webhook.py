@@ -6,9 +6,11 @@ from afbmq import FB
 from afbmq.dispatcher import Dispatcher
 from afbmq.types import Event, RecipientRequest, MessageRequest
 from afbmq.types.message import Message
+from afbmq.utils.executor import setup_uvloop
 
 logging.basicConfig(level=logging.INFO)
 
+setup_uvloop()
 loop = asyncio.get_event_loop()
 fb = FB(confirmation_code=config.FB_CONFIRMATION_CODE,
         access_token=config.FB_ACCESS_TOKEN,
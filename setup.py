@@ -53,6 +53,13 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     packages=setuptools.find_packages(),
     install_requires=reqs,
+    extras_require={
+        'fast': [
+            'uvloop',
+            'orjson',
+            'aiohttp[speedups]',
+        ],
+    },
     classifiers=(
         "Development Status :: 3 - Alpha",
         "Environment :: Console",